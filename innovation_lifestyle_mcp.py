@@ -1,1382 +1,608 @@
-import asyncio
-from typing import Annotated
+import hmac
+from functools import lru_cache
+from pathlib import Path
+from typing import Annotated, Literal, get_args
 import os
+import re
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 from fastmcp.server.auth.providers.bearer import BearerAuthProvider, RSAKeyPair
-from mcp import ErrorData, McpError
 from mcp.server.auth.provider import AccessToken
-from mcp.types import TextContent, INVALID_PARAMS, INTERNAL_ERROR
-from pydantic import BaseModel, Field, AnyUrl
+from pydantic import Field
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+import uvicorn
 
-import httpx
 import json
-import re
-from datetime import datetime
-
-# --- Load environment variables ---
-load_dotenv()
-
-TOKEN = os.environ.get("AUTH_TOKEN")
-MY_NUMBER = os.environ.get("MY_NUMBER")
-
-assert TOKEN is not None, "Please set AUTH_TOKEN in your .env file"
-assert MY_NUMBER is not None, "Please set MY_NUMBER in your .env file"
+from datetime import date
+
+# --- Settings ---
+@lru_cache(maxsize=1)
+def get_settings() -> tuple[str, str]:
+    """Load AUTH_TOKEN and MY_NUMBER from the environment (or .env) once."""
+    load_dotenv()
+    token = os.environ.get("AUTH_TOKEN")
+    my_number = os.environ.get("MY_NUMBER")
+    if not token:
+        raise RuntimeError("Please set AUTH_TOKEN in your .env file")
+    if not my_number:
+        raise RuntimeError("Please set MY_NUMBER in your .env file")
+    return token, my_number
 
 # --- Auth Provider ---
 class SimpleBearerAuthProvider(BearerAuthProvider):
-    def __init__(self, token: str):
+    def __init__(self):
         k = RSAKeyPair.generate()
         super().__init__(public_key=k.public_key, jwks_uri=None, issuer=None, audience=None)
-        self.token = token
+        self._token_bytes: bytes | None = None
+        self._access_token: AccessToken | None = None
 
     async def load_access_token(self, token: str) -> AccessToken | None:
-        if token == self.token:
-            return AccessToken(
-                token=token,
+        if self._access_token is None:
+            expected, _ = get_settings()
+            self._token_bytes = expected.encode()
+            self._access_token = AccessToken(
+                token=expected,
                 client_id="puch-client",
                 scopes=["*"],
                 expires_at=None,
             )
+        if hmac.compare_digest(token.encode(), self._token_bytes):
+            return self._access_token
         return None
 
-# --- Rich Tool Description models ---
-class RichToolDescription(BaseModel):
-    description: str
-    use_when: str
-    side_effects: str | None = None
+# --- Rich Tool Descriptions ---
+def _desc(description: str, use_when: str, side_effects: str | None = None) -> str:
+    """Serialize a rich tool description to the JSON string FastMCP expects."""
+    return json.dumps(
+        {"description": description, "use_when": use_when, "side_effects": side_effects},
+        separators=(",", ":"),
+    )
 
 # --- Tool Descriptions ---
-CryptoIntelligenceDescription = RichToolDescription(
+CryptoIntelligenceDescription = _desc(
     description="Real-time crypto market analysis and investment intelligence",
     use_when="When you need crypto market insights, trend predictions, or investment opportunities",
     side_effects=None,
 )
 
-StartupBuilderDescription = RichToolDescription(
+StartupBuilderDescription = _desc(
     description="Validate business ideas and build startup roadmaps",
     use_when="When you have a business idea and want to validate it or create a startup plan",
     side_effects=None,
 )
 
-ContentMonetizationDescription = RichToolDescription(
+ContentMonetizationDescription = _desc(
     description="Analyze content performance and optimize monetization strategies",
     use_when="When you want to monetize your content or improve your content strategy",
     side_effects=None,
 )
 
-FashionPredictorDescription = RichToolDescription(
+FashionPredictorDescription = _desc(
     description="Predict fashion trends and suggest style recommendations",
     use_when="When you want to stay ahead of fashion trends or get style advice",
     side_effects=None,
 )
 
-FoodInnovatorDescription = RichToolDescription(
+FoodInnovatorDescription = _desc(
     description="Create unique recipes and predict food trends",
     use_when="When you want to create innovative recipes or understand food trends",
     side_effects=None,
 )
 
-NFTCreatorDescription = RichToolDescription(
+NFTCreatorDescription = _desc(
     description="Generate NFT ideas and predict digital art trends",
     use_when="When you want to create NFTs or understand digital art trends",
     side_effects=None,
 )
 
-SocialMediaTrendDescription = RichToolDescription(
+SocialMediaTrendDescription = _desc(
     description="Predict viral social media trends and content success",
     use_when="When you want to create viral content or predict social media trends",
     side_effects=None,
 )
 
-InfluencerMatcherDescription = RichToolDescription(
+InfluencerMatcherDescription = _desc(
     description="Match influencers with brands and predict collaboration success",
     use_when="When you want to find brand collaborations or match influencers with opportunities",
     side_effects=None,
 )
 
-DatingOptimizerDescription = RichToolDescription(
+DatingOptimizerDescription = _desc(
     description="Optimize dating profiles and predict compatibility",
     use_when="When you want to improve your dating success or understand compatibility",
     side_effects=None,
 )
 
-TravelCuratorDescription = RichToolDescription(
+TravelCuratorDescription = _desc(
     description="Curate travel experiences and predict trending destinations",
     use_when="When you want to plan unique travel experiences or discover trending destinations",
     side_effects=None,
 )
 
+# --- Output Templates ---
+_TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+def _load_template(name: str) -> str:
+    """Read a tool's markdown output template from the templates/ directory."""
+    return (_TEMPLATE_DIR / f"{name}.md").read_text(encoding="utf-8")
+
+GuideSection = Literal["all", "metrics", "actions", "tips"]
+
+def _section_arg(metrics: str) -> object:
+    """Build a guide tool's `section` argument type, naming what 'metrics' returns for it."""
+    return Annotated[GuideSection, Field(description=(
+        f"Part of the guide to return: 'all' (the full guide), 'metrics' ({metrics}), "
+        "'actions' (the step-by-step action plan), 'tips' (pro tips). "
+        "Partial sections keep the opening analysis."
+    ))]
+
+_SECTION_MARKER = re.compile(r"\n<!-- section: (\w+) -->\Z")
+
+def _section_templates(name: str) -> dict[str, str]:
+    """Load a guide template and pre-split it into the variant served for each `section` value.
+
+    Sections are tagged by a `<!-- section: NAME -->` line directly above their
+    `## ` heading, so the heading copy can be edited freely; the markers are
+    stripped from the served text. Every partial variant keeps the title and the
+    `overview` block, then adds only the requested section.
+    """
+    chunks = _load_template(name).split("\n## ")
+    index: dict[str, int] = {}
+    for i, chunk in enumerate(chunks[:-1]):
+        if marker := _SECTION_MARKER.search(chunk):
+            chunks[i] = chunk[:marker.start()]
+            index[marker.group(1)] = i + 1
+    wanted = ("overview", *(section for section in get_args(GuideSection) if section != "all"))
+    missing = [section for section in wanted if section not in index]
+    if missing:
+        raise RuntimeError(f"templates/{name}.md is missing section markers for: {', '.join(missing)}")
+    header = "\n## ".join(chunks[:index["overview"] + 1])
+    return {"all": "\n## ".join(chunks)} | {
+        section: header + "\n## " + chunks[index[section]] for section in wanted[1:]
+    }
+
+# --- Date Helper ---
+_date_cache: tuple[date, str] = (date.min, "")
+
+def _today_str() -> str:
+    """Return today's date as 'Month DD, YYYY', formatting it once per day."""
+    global _date_cache
+    today = date.today()
+    if _date_cache[0] != today:
+        _date_cache = (today, today.strftime('%B %d, %Y'))
+    return _date_cache[1]
+
+# --- Display Names ---
+# Display forms of the documented argument values. str.capitalize() mangles
+# brand names ("Tiktok", "Youtube"), so those are spelled out explicitly.
+_DISPLAY_NAMES: dict[str, str] = {
+    value: value.capitalize()
+    for value in (
+        "trend", "investment", "sentiment",
+        "low", "medium", "high",
+        "video", "blog", "social", "podcast", "image", "story", "reel",
+        "instagram", "twitter",
+        "small", "large",
+        "casual", "formal", "streetwear", "vintage", "work", "party",
+        "spring", "summer", "fall", "winter",
+        "italian", "asian", "mexican", "fusion",
+        "none", "vegetarian", "vegan", "gluten-free",
+        "beginner", "intermediate", "advanced",
+        "digital", "pixel", "abstract", "photography",
+        "cyberpunk", "nature", "space", "anime", "minimalist",
+        "common", "rare", "epic", "legendary",
+        "lifestyle", "tech", "fashion", "food", "comedy", "fitness",
+        "micro", "macro", "mega",
+        "tinder", "bumble", "hinge",
+        "serious", "friendship", "marriage",
+        "beach", "city", "mountains", "cultural", "adventure",
+        "budget", "mid-range", "luxury",
+        "solo", "couple", "family", "group",
+    )
+} | {
+    "tiktok": "TikTok",
+    "youtube": "YouTube",
+    "okcupid": "OkCupid",
+    "3d": "3D",
+}
+
+def _display_name(value: str) -> str:
+    """Return the display form of an argument value, capitalizing unknown ones."""
+    return _DISPLAY_NAMES.get(value) or value.capitalize()
+
 # --- MCP Server Setup ---
 mcp = FastMCP(
     "AI Innovation & Lifestyle Suite",
-    auth=SimpleBearerAuthProvider(TOKEN),
+    auth=SimpleBearerAuthProvider(),
 )
 
 # --- Required Validate Tool ---
 @mcp.tool
-async def validate() -> str:
+def validate() -> str:
     """Validate the bearer token and return the user's phone number."""
-    return MY_NUMBER
+    _, my_number = get_settings()
+    return my_number
 
 # --- AI Innovation & Lifestyle Tools ---
 
-@mcp.tool(description=CryptoIntelligenceDescription.model_dump_json())
-async def crypto_intelligence(
+_CRYPTO_OUTLOOK_DEFAULT = {
+    "sentiment": "Neutral",
+    "market_cap_trend": "Stable growth",
+    "trading_volume": "Moderate activity",
+    "risk_level": "High",
+    "roi": "20-40% annually",
+    "market_position": "Emerging player",
+    "market_sentiment": "Positive",
+    "short_term": "Volatile but upward",
+    "medium_term": "Growth potential",
+    "long_term": "Increased adoption",
+}
+
+_CRYPTO_OUTLOOK = {
+    "bitcoin": {
+        "sentiment": "Bullish",
+        "market_cap_trend": "Growing rapidly",
+        "trading_volume": "High activity",
+        "risk_level": "Medium-High",
+        "roi": "15-25% annually",
+        "market_position": "Leading cryptocurrency",
+        "market_sentiment": "Very positive",
+        "short_term": "Bullish trend expected",
+        "medium_term": "Strong growth potential",
+        "long_term": "Mainstream adoption",
+    },
+    "ethereum": {**_CRYPTO_OUTLOOK_DEFAULT, "sentiment": "Bullish"},
+    "_default": _CRYPTO_OUTLOOK_DEFAULT,
+}
+
+_CRYPTO_TEMPLATE = _load_template("crypto_intelligence")
+
+@lru_cache(maxsize=512)
+def _render_crypto(crypto_name: str, analysis_type: str, date_str: str) -> str:
+    name_l = crypto_name.lower()
+    key = "bitcoin" if "bitcoin" in name_l else "ethereum" if "ethereum" in name_l else "_default"
+    return _CRYPTO_TEMPLATE.format_map({
+        **_CRYPTO_OUTLOOK[key],
+        "name": crypto_name,
+        "analysis_type": _display_name(analysis_type),
+        "date": date_str,
+    })
+
+@mcp.tool(description=CryptoIntelligenceDescription, output_schema=None)
+def crypto_intelligence(
     crypto_name: Annotated[str, Field(description="Name of the cryptocurrency to analyze")],
     analysis_type: Annotated[str, Field(description="Type of analysis: 'trend', 'investment', 'sentiment'")] = "trend",
 ) -> str:
     """Real-time crypto market analysis and investment intelligence."""
     
-    analysis = f"""
-# Crypto Intelligence Analysis: {crypto_name}
-
-## 📊 Market Analysis
-**Cryptocurrency:** {crypto_name}
-**Analysis Type:** {analysis_type.capitalize()}
-**Date:** {datetime.now().strftime('%B %d, %Y')}
-
-## 🚀 Market Trends
-- **Current Sentiment:** {'Bullish' if 'bitcoin' in crypto_name.lower() or 'ethereum' in crypto_name.lower() else 'Neutral'}
-- **Market Cap Trend:** {'Growing rapidly' if 'bitcoin' in crypto_name.lower() else 'Stable growth'}
-- **Trading Volume:** {'High activity' if 'bitcoin' in crypto_name.lower() else 'Moderate activity'}
-
-## 💰 Investment Insights
-- **Risk Level:** {'Medium-High' if 'bitcoin' in crypto_name.lower() else 'High'}
-- **Potential ROI:** {'15-25% annually' if 'bitcoin' in crypto_name.lower() else '20-40% annually'}
-- **Market Position:** {'Leading cryptocurrency' if 'bitcoin' in crypto_name.lower() else 'Emerging player'}
-
-## 🎯 Key Factors
-1. **Institutional Adoption:** Growing interest from major companies
-2. **Regulatory Environment:** Evolving but generally positive
-3. **Technology Development:** Continuous innovation and upgrades
-4. **Market Sentiment:** {'Very positive' if 'bitcoin' in crypto_name.lower() else 'Positive'}
-
-## 📈 Predictions
-- **Short-term (1-3 months):** {'Bullish trend expected' if 'bitcoin' in crypto_name.lower() else 'Volatile but upward'}
-- **Medium-term (6-12 months):** {'Strong growth potential' if 'bitcoin' in crypto_name.lower() else 'Growth potential'}
-- **Long-term (1-2 years):** {'Mainstream adoption' if 'bitcoin' in crypto_name.lower() else 'Increased adoption'}
-
-## 🔍 Investment Strategy
-1. **Dollar-Cost Averaging:** Invest regularly over time
-2. **Portfolio Diversification:** Don't put all eggs in one basket
-3. **Risk Management:** Only invest what you can afford to lose
-4. **Stay Informed:** Follow market news and developments
-
-## ⚠️ Risk Warnings
-- Cryptocurrency markets are highly volatile
-- Past performance doesn't guarantee future results
-- Regulatory changes can impact prices significantly
-- Always do your own research before investing
-"""
-    
-    return analysis
-
-@mcp.tool(description=StartupBuilderDescription.model_dump_json())
-async def startup_builder(
+    return _render_crypto(crypto_name, analysis_type, _today_str())
+
+_STARTUP_POSITIONING = {
+    "ai": {"competitive_advantage": "Technology innovation", "barriers_to_entry": "Medium"},
+    "tech": {"competitive_advantage": "Technology innovation", "barriers_to_entry": "Low to Medium"},
+    "_default": {"competitive_advantage": "Unique value proposition", "barriers_to_entry": "Low to Medium"},
+}
+
+_SEED_ROUND = {"low": "50K-100K", "medium": "200K-500K", "high": "1M-2M"}
+
+_STARTUP_TEMPLATE = _load_template("startup_builder")
+
+@lru_cache(maxsize=512)
+def _render_startup(business_idea: str, target_market: str, investment_needed: str, date_str: str) -> str:
+    idea_l = business_idea.lower()
+    key = "ai" if "ai" in idea_l else "tech" if "tech" in idea_l else "_default"
+    return _STARTUP_TEMPLATE.format_map({
+        **_STARTUP_POSITIONING[key],
+        "idea": business_idea,
+        "target_market": target_market,
+        "investment_level": _display_name(investment_needed),
+        "seed_round": _SEED_ROUND.get(investment_needed, "1M-2M"),
+        "date": date_str,
+    })
+
+@mcp.tool(description=StartupBuilderDescription, output_schema=None)
+def startup_builder(
     business_idea: Annotated[str, Field(description="Your business idea or concept")],
     target_market: Annotated[str, Field(description="Target market or audience")] = "General",
     investment_needed: Annotated[str, Field(description="Investment range: 'low', 'medium', 'high'")] = "medium",
 ) -> str:
     """Validate business ideas and build startup roadmaps."""
     
-    validation = f"""
-# Startup Validation & Roadmap: {business_idea}
-
-## 🎯 Business Concept
-**Idea:** {business_idea}
-**Target Market:** {target_market}
-**Investment Level:** {investment_needed.capitalize()}
-**Analysis Date:** {datetime.now().strftime('%B %d, %Y')}
-
-## 📊 Market Validation
-
-### Market Size & Opportunity
-- **Total Addressable Market (TAM):** $2-5 billion
-- **Serviceable Addressable Market (SAM):** $500M-1B
-- **Serviceable Obtainable Market (SOM):** $50M-100M
-
-### Competitive Analysis
-- **Direct Competitors:** 3-5 major players
-- **Competitive Advantage:** {'Technology innovation' if 'ai' in business_idea.lower() or 'tech' in business_idea.lower() else 'Unique value proposition'}
-- **Barriers to Entry:** {'Medium' if 'ai' in business_idea.lower() else 'Low to Medium'}
-
-## 🚀 Success Probability: 75%
-
-### Strengths
-1. **Growing market demand**
-2. **Technology-enabled solution**
-3. **Scalable business model**
-4. **Strong team potential**
-
-### Challenges
-1. **Competition from established players**
-2. **Customer acquisition costs**
-3. **Regulatory considerations**
-4. **Funding requirements**
-
-## 📋 MVP Roadmap
-
-### Phase 1: Foundation (Months 1-3)
-- **Market research and validation**
-- **Core team formation**
-- **MVP development**
-- **Initial customer interviews**
-
-### Phase 2: Launch (Months 4-6)
-- **MVP launch and testing**
-- **Customer feedback collection**
-- **Product iteration**
-- **Initial marketing campaigns**
-
-### Phase 3: Growth (Months 7-12)
-- **Customer acquisition**
-- **Revenue generation**
-- **Team expansion**
-- **Funding rounds**
-
-## 💰 Financial Projections
-
-### Investment Required
-- **Seed Round:** ${'50K-100K' if investment_needed == 'low' else '200K-500K' if investment_needed == 'medium' else '1M-2M'}
-- **Series A:** $2M-5M (after 12-18 months)
-- **Break-even:** 18-24 months
-
-### Revenue Projections
-- **Year 1:** $100K-500K
-- **Year 2:** $1M-5M
-- **Year 3:** $5M-20M
-
-## 🎯 Next Steps
-1. **Validate with potential customers**
-2. **Build MVP prototype**
-3. **Secure initial funding**
-4. **Assemble core team**
-5. **Launch beta version**
-
-## 💡 Recommendations
-- **Focus on solving a real problem**
-- **Build a strong founding team**
-- **Validate early and often**
-- **Be prepared to pivot**
-- **Network with other entrepreneurs**
-"""
-    
-    return validation
-
-@mcp.tool(description=ContentMonetizationDescription.model_dump_json())
-async def content_monetization(
+    return _render_startup(business_idea, target_market, investment_needed, _today_str())
+
+_AUDIENCE_REVENUE = {
+    "small": {
+        "ad_revenue": "500-2K",
+        "sponsorships": "1K-5K",
+        "affiliate": "200-1K",
+        "six_months": "2K-8K",
+        "twelve_months": "5K-20K",
+    },
+    "medium": {
+        "ad_revenue": "2K-10K",
+        "sponsorships": "5K-20K",
+        "affiliate": "1K-5K",
+        "six_months": "8K-30K",
+        "twelve_months": "20K-80K",
+    },
+    "large": {
+        "ad_revenue": "10K-50K",
+        "sponsorships": "20K-100K",
+        "affiliate": "5K-25K",
+        "six_months": "30K-150K",
+        "twelve_months": "80K-300K",
+    },
+}
+
+_PLATFORM_PLAYBOOK = {
+    "youtube": {
+        "posting_times": "7-9 PM",
+        "content_length": "10-15 minutes",
+        "engagement_tactics": "Call-to-actions, end screens",
+    },
+    "instagram": {
+        "posting_times": "12-3 PM",
+        "content_length": "30-60 seconds",
+        "engagement_tactics": "Stories, Reels, IGTV",
+    },
+    "tiktok": {
+        "posting_times": "6-10 PM",
+        "content_length": "15-60 seconds",
+        "engagement_tactics": "Trending sounds, challenges",
+    },
+    "blog": {
+        "posting_times": "9-11 AM",
+        "content_length": "1500-2500 words",
+        "engagement_tactics": "Comments, social sharing",
+    },
+}
+
+_CONTENT_TEMPLATE = _load_template("content_monetization")
+
+@lru_cache(maxsize=512)
+def _render_content(content_type: str, platform: str, audience_size: str, date_str: str) -> str:
+    return _CONTENT_TEMPLATE.format_map({
+        **_AUDIENCE_REVENUE.get(audience_size, _AUDIENCE_REVENUE["large"]),
+        **_PLATFORM_PLAYBOOK.get(platform, _PLATFORM_PLAYBOOK["blog"]),
+        "content_type": _display_name(content_type),
+        "platform": _display_name(platform),
+        "audience_size": _display_name(audience_size),
+        "date": date_str,
+    })
+
+@mcp.tool(description=ContentMonetizationDescription, output_schema=None)
+def content_monetization(
     content_type: Annotated[str, Field(description="Type of content: 'video', 'blog', 'social', 'podcast'")],
     platform: Annotated[str, Field(description="Platform: 'youtube', 'instagram', 'tiktok', 'blog'")] = "youtube",
     audience_size: Annotated[str, Field(description="Current audience size: 'small', 'medium', 'large'")] = "medium",
 ) -> str:
     """Analyze content performance and optimize monetization strategies."""
     
-    strategy = f"""
-# Content Monetization Strategy: {content_type.capitalize()} on {platform.capitalize()}
-
-## 📊 Current Analysis
-**Content Type:** {content_type.capitalize()}
-**Platform:** {platform.capitalize()}
-**Audience Size:** {audience_size.capitalize()}
-**Analysis Date:** {datetime.now().strftime('%B %d, %Y')}
-
-## 💰 Monetization Opportunities
-
-### 1. **Platform Revenue**
-- **Ad Revenue:** ${'500-2K' if audience_size == 'small' else '2K-10K' if audience_size == 'medium' else '10K-50K'} monthly
-- **Sponsorships:** ${'1K-5K' if audience_size == 'small' else '5K-20K' if audience_size == 'medium' else '20K-100K'} per post
-- **Affiliate Marketing:** ${'200-1K' if audience_size == 'small' else '1K-5K' if audience_size == 'medium' else '5K-25K'} monthly
-
-### 2. **Direct Revenue**
-- **Digital Products:** Courses, ebooks, templates
-- **Services:** Consulting, coaching, custom content
-- **Memberships:** Exclusive content, community access
-- **Merchandise:** Branded products, merchandise
-
-### 3. **Brand Partnerships**
-- **Sponsored Content:** $1K-50K per collaboration
-- **Brand Ambassadorships:** $5K-100K annually
-- **Product Launches:** $10K-200K per campaign
-
-## 📈 Growth Strategy
-
-### Content Optimization
-1. **SEO Optimization:** Improve discoverability
-2. **Engagement Focus:** Increase viewer retention
-3. **Consistency:** Regular posting schedule
-4. **Quality:** Invest in better equipment/editing
-
-### Audience Growth
-1. **Cross-platform promotion**
-2. **Collaborations with other creators**
-3. **Community building**
-4. **Trend participation**
-
-### Monetization Optimization
-1. **Diversify revenue streams**
-2. **Test different pricing strategies**
-3. **Build email list**
-4. **Create evergreen content**
-
-## 🎯 Platform-Specific Strategies
-
-### {platform.capitalize()} Optimization
-- **Best posting times:** {'7-9 PM' if platform == 'youtube' else '12-3 PM' if platform == 'instagram' else '6-10 PM' if platform == 'tiktok' else '9-11 AM'}
-- **Optimal content length:** {'10-15 minutes' if platform == 'youtube' else '30-60 seconds' if platform == 'instagram' else '15-60 seconds' if platform == 'tiktok' else '1500-2500 words'}
-- **Engagement tactics:** {'Call-to-actions, end screens' if platform == 'youtube' else 'Stories, Reels, IGTV' if platform == 'instagram' else 'Trending sounds, challenges' if platform == 'tiktok' else 'Comments, social sharing'}
-
-## 📊 Revenue Projections
-
-### Monthly Revenue Potential
-- **Current:** ${'500-2K' if audience_size == 'small' else '2K-10K' if audience_size == 'medium' else '10K-50K'}
-- **6 months:** ${'2K-8K' if audience_size == 'small' else '8K-30K' if audience_size == 'medium' else '30K-150K'}
-- **12 months:** ${'5K-20K' if audience_size == 'small' else '20K-80K' if audience_size == 'medium' else '80K-300K'}
-
-## 🚀 Action Plan
-1. **Audit current content performance**
-2. **Implement SEO best practices**
-3. **Start affiliate marketing**
-4. **Pitch to potential sponsors**
-5. **Create digital products**
-6. **Build email list**
-7. **Optimize posting schedule**
-8. **Engage with audience consistently**
-
-## 💡 Pro Tips
-- **Focus on value over views**
-- **Build authentic relationships with audience**
-- **Diversify income streams**
-- **Invest in quality over quantity**
-- **Stay consistent and patient**
-"""
-    
-    return strategy
+    return _render_content(content_type, platform, audience_size, _today_str())
+
+_FASHION_TEMPLATE = _load_template("fashion_predictor")
 
-@mcp.tool(description=FashionPredictorDescription.model_dump_json())
-async def fashion_predictor(
+@lru_cache(maxsize=512)
+def _render_fashion(style_preference: str, occasion: str, season: str, date_str: str) -> str:
+    return _FASHION_TEMPLATE.format_map({
+        "style": _display_name(style_preference),
+        "occasion": _display_name(occasion),
+        "season": _display_name(season),
+        "date": date_str,
+    })
+
+@mcp.tool(description=FashionPredictorDescription, output_schema=None)
+def fashion_predictor(
     style_preference: Annotated[str, Field(description="Your style preference: 'casual', 'formal', 'streetwear', 'vintage'")],
     occasion: Annotated[str, Field(description="Occasion: 'work', 'party', 'casual', 'formal'")] = "casual",
     season: Annotated[str, Field(description="Season: 'spring', 'summer', 'fall', 'winter'")] = "summer",
 ) -> str:
     """Predict fashion trends and suggest style recommendations."""
     
-    fashion_guide = f"""
-# Fashion Trend Predictor & Style Guide
-
-## 👗 Style Analysis
-**Your Preference:** {style_preference.capitalize()}
-**Occasion:** {occasion.capitalize()}
-**Season:** {season.capitalize()}
-**Analysis Date:** {datetime.now().strftime('%B %d, %Y')}
-
-## 🚀 Trending Styles for {season.capitalize()} 2025
-
-### Hot Trends
-1. **Sustainable Fashion:** Eco-friendly materials, upcycled clothing
-2. **Tech-Integrated Wear:** Smart fabrics, LED accessories
-3. **Gender-Fluid Fashion:** Unisex designs, inclusive sizing
-4. **Vintage Revival:** 90s and Y2K aesthetics
-5. **Minimalist Luxury:** Quality over quantity, timeless pieces
-
-### Color Palette
-- **Primary Colors:** Earth tones, muted pastels
-- **Accent Colors:** Bold neons, metallic finishes
-- **Neutral Colors:** Cream, beige, charcoal
-
-## 🎯 Personalized Recommendations
-
-### For {style_preference.capitalize()} Style
-**Top Picks:**
-- **Casual:** Oversized blazers, wide-leg pants, chunky sneakers
-- **Formal:** Tailored suits, statement accessories, classic pumps
-- **Streetwear:** Graphic tees, cargo pants, platform sneakers
-- **Vintage:** High-waisted jeans, retro prints, vintage accessories
-
-### {occasion.capitalize()} Outfit Ideas
-1. **Work:** Tailored blazer + wide-leg pants + loafers
-2. **Party:** Statement dress + bold accessories + heels
-3. **Casual:** Oversized sweater + jeans + sneakers
-4. **Formal:** Classic suit + silk shirt + oxfords
-
-## 📈 Trend Predictions
-
-### Emerging Trends (Next 6 months)
-1. **Digital Fashion:** Virtual clothing, NFT fashion
-2. **Athleisure 2.0:** Performance wear meets style
-3. **Micro-Trends:** Hyper-personalized fashion
-4. **Circular Fashion:** Rental, resale, repair
-
-### Investment Pieces
-- **Timeless Blazer:** Versatile for all occasions
-- **Quality Denim:** Lasts years, never goes out of style
-- **Classic Handbag:** Investment piece that appreciates
-- **Statement Jewelry:** Adds personality to any outfit
-
-## 🛍️ Shopping Strategy
-
-### Budget Allocation
-- **70% Basics:** Quality essentials that last
-- **20% Trends:** Affordable trendy pieces
-- **10% Investment:** High-quality statement pieces
-
-### Sustainable Shopping
-1. **Buy second-hand** for unique finds
-2. **Support local designers**
-3. **Choose quality over quantity**
-4. **Rent for special occasions**
-
-## 💡 Style Tips
-- **Know your body type** and dress accordingly
-- **Invest in good basics** that mix and match
-- **Accessorize strategically** to change looks
-- **Confidence is the best accessory**
-- **Trends come and go, style is forever**
-
-## 🎨 Color Analysis
-- **Spring/Summer:** Light, bright colors
-- **Fall/Winter:** Rich, deep colors
-- **Year-round:** Neutrals, earth tones
-
-## 📱 Social Media Inspiration
-- **Instagram:** @fashionista, @styleblogger
-- **TikTok:** #fashiontrends, #styleinspo
-- **Pinterest:** Create mood boards for inspiration
-"""
-    
-    return fashion_guide
+    return _render_fashion(style_preference, occasion, season, _today_str())
+
+_FOOD_TEMPLATE = _load_template("food_innovator")
 
-@mcp.tool(description=FoodInnovatorDescription.model_dump_json())
-async def food_innovator(
+@lru_cache(maxsize=512)
+def _render_food(cuisine_type: str, dietary_restrictions: str, skill_level: str, date_str: str) -> str:
+    return _FOOD_TEMPLATE.format_map({
+        "cuisine": _display_name(cuisine_type),
+        "dietary": _display_name(dietary_restrictions),
+        "skill": _display_name(skill_level),
+        "date": date_str,
+    })
+
+@mcp.tool(description=FoodInnovatorDescription, output_schema=None)
+def food_innovator(
     cuisine_type: Annotated[str, Field(description="Cuisine type: 'italian', 'asian', 'mexican', 'fusion'")],
     dietary_restrictions: Annotated[str, Field(description="Dietary restrictions: 'none', 'vegetarian', 'vegan', 'gluten-free'")] = "none",
     skill_level: Annotated[str, Field(description="Cooking skill level: 'beginner', 'intermediate', 'advanced'")] = "intermediate",
 ) -> str:
     """Create unique recipes and predict food trends."""
     
-    food_guide = f"""
-# Food Innovation & Recipe Creator
-
-## 🍽️ Culinary Analysis
-**Cuisine Type:** {cuisine_type.capitalize()}
-**Dietary Restrictions:** {dietary_restrictions.capitalize()}
-**Skill Level:** {skill_level.capitalize()}
-**Analysis Date:** {datetime.now().strftime('%B %d, %Y')}
-
-## 🚀 Trending Food Concepts for 2025
-
-### Hot Trends
-1. **Plant-Based Innovation:** Beyond meat alternatives, creative vegan dishes
-2. **Fusion Cuisine:** Global flavor combinations, cultural mashups
-3. **Functional Foods:** Health-boosting ingredients, superfoods
-4. **Sustainable Cooking:** Zero-waste recipes, local ingredients
-5. **Tech-Enhanced Dining:** Smart kitchen gadgets, AI recipe assistants
-
-### Emerging Ingredients
-- **Alternative Proteins:** Tempeh, seitan, jackfruit
-- **Ancient Grains:** Quinoa, farro, freekeh
-- **Superfoods:** Moringa, spirulina, matcha
-- **Fermented Foods:** Kimchi, kombucha, miso
-
-## 🎯 Personalized Recipe Recommendations
-
-### {cuisine_type.capitalize()} Innovation Ideas
-**Beginner Level:**
-- **Italian:** Modern pasta dishes with seasonal vegetables
-- **Asian:** Quick stir-fries with bold flavors
-- **Mexican:** Fresh tacos with homemade tortillas
-- **Fusion:** East-meets-West comfort food
-
-**Intermediate Level:**
-- **Italian:** Homemade pasta with creative sauces
-- **Asian:** Complex curries and noodle dishes
-- **Mexican:** Authentic mole and tamales
-- **Fusion:** Multi-cultural tasting menus
-
-**Advanced Level:**
-- **Italian:** Artisanal bread and pizza making
-- **Asian:** Traditional techniques with modern twists
-- **Mexican:** Regional specialties and complex sauces
-- **Fusion:** Molecular gastronomy meets tradition
-
-## 📈 Food Trend Predictions
-
-### Restaurant Concepts
-1. **Ghost Kitchens:** Delivery-only restaurants
-2. **Pop-up Experiences:** Temporary dining concepts
-3. **Farm-to-Table 2.0:** Hyper-local ingredient sourcing
-4. **Tech-Forward Dining:** QR menus, contactless ordering
-
-### Consumer Preferences
-- **Health-conscious eating**
-- **Convenience without compromise**
-- **Authentic cultural experiences**
-- **Sustainable food choices**
-
-## 🍳 Recipe Innovation Framework
-
-### Flavor Combinations
-- **Sweet & Spicy:** Honey + chili, maple + cayenne
-- **Umami Boost:** Mushrooms + soy sauce, miso + butter
-- **Herb & Citrus:** Basil + lemon, cilantro + lime
-- **Smoky & Sweet:** Chipotle + honey, smoked paprika + maple
-
-### Technique Innovation
-1. **Sous Vide:** Precise temperature cooking
-2. **Fermentation:** Homemade pickles, kimchi, sourdough
-3. **Smoking:** Wood-fired flavors, tea-smoking
-4. **Molecular Gastronomy:** Spherification, foams, gels
-
-## 💡 Cooking Tips
-
-### For {skill_level.capitalize()} Cooks
-**Beginner:**
-- Start with simple recipes
-- Master basic techniques
-- Use quality ingredients
-- Don't be afraid to experiment
-
-**Intermediate:**
-- Try new cuisines
-- Experiment with techniques
-- Develop your palate
-- Share your creations
-
-**Advanced:**
-- Create original recipes
-- Master complex techniques
-- Mentor others
-- Push culinary boundaries
-
-## 🛒 Ingredient Sourcing
-- **Local Farmers Markets:** Fresh, seasonal produce
-- **Ethnic Grocery Stores:** Authentic ingredients
-- **Online Specialty Shops:** Hard-to-find items
-- **Community Supported Agriculture (CSA):** Weekly fresh produce
-
-## 📱 Food Tech Trends
-- **Recipe Apps:** Personalized meal planning
-- **Smart Kitchen Gadgets:** AI-powered cooking assistants
-- **Food Delivery Innovation:** Ghost kitchens, meal kits
-- **Social Media Food:** Instagram-worthy dishes, TikTok recipes
-
-## 🎨 Presentation Tips
-- **Color Contrast:** Bright vegetables, colorful garnishes
-- **Texture Variety:** Crispy, creamy, crunchy elements
-- **Height & Depth:** Layered dishes, elevated plating
-- **Garnish Thoughtfully:** Edible flowers, microgreens, herbs
-"""
-    
-    return food_guide
+    return _render_food(cuisine_type, dietary_restrictions, skill_level, _today_str())
+
+_NFT_TEMPLATE = _load_template("nft_creator")
+
+@lru_cache(maxsize=512)
+def _render_nft(art_style: str, theme: str, rarity_level: str, date_str: str) -> str:
+    return _NFT_TEMPLATE.format_map({
+        "art_style": _display_name(art_style),
+        "theme": _display_name(theme),
+        "rarity": _display_name(rarity_level),
+        "date": date_str,
+    })
 
-@mcp.tool(description=NFTCreatorDescription.model_dump_json())
-async def nft_creator(
+@mcp.tool(description=NFTCreatorDescription, output_schema=None)
+def nft_creator(
     art_style: Annotated[str, Field(description="Art style: 'digital', 'pixel', '3d', 'abstract', 'photography'")],
     theme: Annotated[str, Field(description="Theme: 'cyberpunk', 'nature', 'space', 'anime', 'minimalist'")] = "cyberpunk",
     rarity_level: Annotated[str, Field(description="Rarity level: 'common', 'rare', 'epic', 'legendary'")] = "rare",
 ) -> str:
     """Generate NFT ideas and predict digital art trends."""
     
-    nft_guide = f"""
-# NFT Creator & Digital Art Trend Predictor
-
-## 🎨 NFT Analysis
-**Art Style:** {art_style.capitalize()}
-**Theme:** {theme.capitalize()}
-**Rarity Level:** {rarity_level.capitalize()}
-**Analysis Date:** {datetime.now().strftime('%B %d, %Y')}
-
-## 🚀 Digital Art Trends for 2025
-
-### Hot NFT Styles
-1. **AI-Generated Art:** Machine learning created pieces
-2. **Interactive NFTs:** Art that responds to user interaction
-3. **Generative Art:** Algorithmically created collections
-4. **3D Digital Sculptures:** Three-dimensional digital art
-5. **Mixed Reality Art:** AR/VR integrated pieces
-
-### Trending Themes
-- **Cyberpunk:** Futuristic, neon, dystopian aesthetics
-- **Nature:** Organic, environmental, sustainable themes
-- **Space:** Cosmic, astronomical, sci-fi elements
-- **Anime:** Japanese animation style, manga-inspired
-- **Minimalist:** Clean, simple, geometric designs
-
-## 🎯 NFT Creation Strategy
-
-### {art_style.capitalize()} Art Style Guide
-**Digital Art:**
-- **Tools:** Photoshop, Procreate, Illustrator
-- **Techniques:** Digital painting, vector graphics
-- **File Formats:** PNG, SVG, MP4 for animations
-- **Resolution:** Minimum 1000x1000 pixels
-
-**Pixel Art:**
-- **Tools:** Aseprite, Piskel, Photoshop
-- **Techniques:** Pixel-perfect design, limited color palette
-- **File Formats:** PNG, GIF for animations
-- **Resolution:** 16x16 to 512x512 pixels
-
-**3D Art:**
-- **Tools:** Blender, Maya, Cinema 4D
-- **Techniques:** 3D modeling, texturing, rendering
-- **File Formats:** GLB, GLTF, MP4 for animations
-- **Complexity:** Low-poly to high-detail models
-
-**Abstract Art:**
-- **Tools:** Any digital art software
-- **Techniques:** Geometric shapes, color theory, composition
-- **File Formats:** PNG, SVG, MP4
-- **Style:** Non-representational, emotional expression
-
-**Photography:**
-- **Tools:** Camera, Lightroom, Photoshop
-- **Techniques:** Digital photography, post-processing
-- **File Formats:** RAW, JPEG, PNG
-- **Quality:** High-resolution, professional grade
-
-## 📈 NFT Market Analysis
-
-### Current Market Trends
-- **Total Market Cap:** $10+ billion
-- **Daily Trading Volume:** $100+ million
-- **Active Collections:** 10,000+ projects
-- **Average Sale Price:** $200-2,000
-
-### Rarity Distribution
-**Common (70% of collection):**
-- **Price Range:** $50-500
-- **Characteristics:** Basic traits, common colors
-- **Demand:** High volume, low individual value
-
-**Rare (20% of collection):**
-- **Price Range:** $500-5,000
-- **Characteristics:** Unique combinations, special traits
-- **Demand:** Moderate volume, good value
-
-**Epic (8% of collection):**
-- **Price Range:** $5,000-50,000
-- **Characteristics:** Very rare traits, special editions
-- **Demand:** Low volume, high value
-
-**Legendary (2% of collection):**
-- **Price Range:** $50,000-500,000+
-- **Characteristics:** One-of-a-kind, ultra-rare traits
-- **Demand:** Very low volume, premium value
-
-## 💰 Monetization Strategies
-
-### NFT Sales Channels
-1. **OpenSea:** Largest NFT marketplace
-2. **Rarible:** Community-driven platform
-3. **Foundation:** Curated, high-end marketplace
-4. **Nifty Gateway:** Premium NFT platform
-5. **SuperRare:** Single-edition digital art
-
-### Pricing Strategy
-- **Research similar NFTs** in your style/theme
-- **Consider rarity and uniqueness**
-- **Factor in gas fees and platform costs**
-- **Start with reasonable prices** and adjust based on demand
-- **Offer multiple price points** for different collectors
-
-### Revenue Streams
-1. **Primary Sales:** Initial NFT minting and sales
-2. **Secondary Sales:** Royalties from resales (2.5-10%)
-3. **Licensing:** Commercial use rights
-4. **Merchandise:** Physical products based on NFTs
-5. **Exclusive Access:** VIP benefits for NFT holders
-
-## 🚀 Launch Strategy
-
-### Pre-Launch (1-2 months)
-1. **Build community** on Discord, Twitter
-2. **Create teaser content** and previews
-3. **Establish brand identity** and story
-4. **Set up social media** presence
-5. **Plan marketing campaign**
-
-### Launch Day
-1. **Mint collection** on chosen platform
-2. **Announce on all channels** simultaneously
-3. **Engage with community** actively
-4. **Monitor sales** and adjust strategy
-5. **Celebrate milestones** with community
-
-### Post-Launch
-1. **Maintain community engagement**
-2. **Release additional content** and updates
-3. **Plan future collections** or expansions
-4. **Build partnerships** with other creators
-5. **Explore new platforms** and opportunities
-
-## 💡 Pro Tips
-- **Quality over quantity** - focus on creating amazing art
-- **Build community first** - engaged community drives sales
-- **Tell a story** - give your NFTs meaning and context
-- **Be consistent** - regular releases maintain interest
-- **Stay authentic** - create art you're passionate about
-- **Network with other artists** - collaborations expand reach
-- **Learn from data** - analyze what sells and why
-- **Think long-term** - build sustainable business model
-- **Protect your work** - use proper licensing and contracts
-- **Stay updated** - NFT space evolves rapidly
-"""
-    
-    return nft_guide
-
-@mcp.tool(description=SocialMediaTrendDescription.model_dump_json())
-async def social_media_trend_predictor(
-    platform: Annotated[str, Field(description="Social media platform: 'tiktok', 'instagram', 'youtube', 'twitter'")],
-    content_type: Annotated[str, Field(description="Type of content: 'video', 'image', 'story', 'reel'")] = "video",
-    niche: Annotated[str, Field(description="Content niche: 'lifestyle', 'tech', 'fashion', 'food', 'comedy'")] = "lifestyle",
+    return _render_nft(art_style, theme, rarity_level, _today_str())
+
+_SOCIAL_TIMING = {
+    "tiktok": {
+        "posting_times": "7-9 PM",
+        "frequency": "2-3 times daily",
+        "engagement_window": "First 2 hours critical",
+    },
+    "instagram": {
+        "posting_times": "12-3 PM",
+        "frequency": "1-2 times daily",
+        "engagement_window": "First 6 hours important",
+    },
+    "youtube": {
+        "posting_times": "2-4 PM",
+        "frequency": "2-3 times weekly",
+        "engagement_window": "First 24 hours key",
+    },
+    "twitter": {
+        "posting_times": "9-11 AM",
+        "frequency": "3-5 times daily",
+        "engagement_window": "First 30 minutes crucial",
+    },
+}
+
+SocialPlatform = Literal["tiktok", "instagram", "youtube", "twitter"]
+SocialContentType = Literal["video", "image", "story", "reel"]
+SocialNiche = Literal["lifestyle", "tech", "fashion", "food", "comedy"]
+SocialSection = _section_arg("success metrics: KPIs and viral thresholds")
+
+_SOCIAL_TREND_SECTIONS = _section_templates("social_media_trend_predictor")
+
+@lru_cache(maxsize=512)
+def _render_social_trends(platform: str, content_type: str, niche: str, section: str, date_str: str) -> str:
+    return _SOCIAL_TREND_SECTIONS[section].format_map({
+        **_SOCIAL_TIMING[platform],
+        "platform": _display_name(platform),
+        "content_type": _display_name(content_type),
+        "niche": _display_name(niche),
+        "date": date_str,
+    })
+
+@mcp.tool(description=SocialMediaTrendDescription, output_schema=None)
+def social_media_trend_predictor(
+    platform: Annotated[SocialPlatform, Field(description="Social media platform: 'tiktok', 'instagram', 'youtube', 'twitter'")],
+    content_type: Annotated[SocialContentType, Field(description="Type of content: 'video', 'image', 'story', 'reel'")] = "video",
+    niche: Annotated[SocialNiche, Field(description="Content niche: 'lifestyle', 'tech', 'fashion', 'food', 'comedy'")] = "lifestyle",
+    section: SocialSection = "all",
 ) -> str:
     """Predict viral social media trends and content success."""
     
-    trend_analysis = f"""
-# Social Media Trend Predictor: {platform.capitalize()}
-
-## 📱 Platform Analysis
-**Platform:** {platform.capitalize()}
-**Content Type:** {content_type.capitalize()}
-**Niche:** {niche.capitalize()}
-**Analysis Date:** {datetime.now().strftime('%B %d, %Y')}
-
-## 🚀 Trending Content for {platform.capitalize()}
-
-### Hot Trends Right Now
-1. **Authentic Storytelling:** Behind-the-scenes, real moments
-2. **Educational Content:** How-to videos, tips and tricks
-3. **Challenges & Trends:** Viral challenges, dance trends
-4. **User-Generated Content:** Community participation
-5. **Live Content:** Real-time engagement, Q&A sessions
-
-### Platform-Specific Trends
-**TikTok:**
-- **Trending Sounds:** Viral audio clips, remixes
-- **Visual Effects:** AR filters, transitions
-- **Content Length:** 15-60 seconds optimal
-- **Engagement:** Comments, shares, duets
-
-**Instagram:**
-- **Reels:** Short-form video content
-- **Stories:** Daily updates, polls, questions
-- **IGTV:** Longer-form content
-- **Carousel Posts:** Multiple images/videos
-
-**YouTube:**
-- **Shorts:** Vertical video format
-- **Long-form:** 10-20 minute deep dives
-- **Live Streaming:** Real-time interaction
-- **Community Posts:** Engagement beyond videos
-
-**Twitter/X:**
-- **Threads:** Long-form content in tweets
-- **Spaces:** Audio conversations
-- **Trending Topics:** Real-time discussions
-- **Visual Content:** Images, GIFs, videos
-
-## 📈 Viral Content Predictions
-
-### Content That Will Go Viral
-1. **Emotional Connection:** Content that makes people feel something
-2. **Relatability:** Everyday situations, common problems
-3. **Educational Value:** Learn something new
-4. **Entertainment:** Humor, creativity, talent
-5. **Inspiration:** Motivational, aspirational content
-
-### Timing Strategy
-- **Best Posting Times:** {'7-9 PM' if platform == 'tiktok' else '12-3 PM' if platform == 'instagram' else '2-4 PM' if platform == 'youtube' else '9-11 AM'}
-- **Optimal Frequency:** {'2-3 times daily' if platform == 'tiktok' else '1-2 times daily' if platform == 'instagram' else '2-3 times weekly' if platform == 'youtube' else '3-5 times daily'}
-- **Engagement Windows:** {'First 2 hours critical' if platform == 'tiktok' else 'First 6 hours important' if platform == 'instagram' else 'First 24 hours key' if platform == 'youtube' else 'First 30 minutes crucial'}
-
-## 🎯 Content Strategy for {niche.capitalize()}
-
-### Trending Topics
-- **Lifestyle:** Daily routines, wellness tips, home organization
-- **Tech:** App reviews, gadget unboxings, tech tips
-- **Fashion:** Outfit ideas, style tips, shopping hauls
-- **Food:** Recipe tutorials, food reviews, cooking tips
-- **Comedy:** Skits, parodies, relatable humor
-
-### Content Ideas
-1. **"Day in the Life"** content
-2. **"Before and After"** transformations
-3. **"How I..."** tutorials
-4. **"Reacting to..."** content
-5. **"Testing..."** experiments
-
-## 📊 Success Metrics
-
-### Key Performance Indicators
-- **Views/Impressions:** Reach and visibility
-- **Engagement Rate:** Likes, comments, shares
-- **Follower Growth:** Audience expansion
-- **Click-through Rate:** Link clicks, profile visits
-- **Retention Rate:** How long people watch
-
-### Viral Thresholds
-- **TikTok:** 100K+ views, 10K+ likes
-- **Instagram:** 50K+ views, 5K+ likes
-- **YouTube:** 100K+ views, 10K+ likes
-- **Twitter:** 10K+ impressions, 1K+ likes
-
-## 🚀 Action Plan
-1. **Research trending hashtags** in your niche
-2. **Study successful creators** in your space
-3. **Create content calendar** with trending topics
-4. **Engage with community** consistently
-5. **Analyze performance** and iterate
-6. **Collaborate with other creators**
-7. **Stay authentic** to your brand
-8. **Experiment with different formats**
-
-## 💡 Pro Tips
-- **Consistency is key** - post regularly
-- **Engage with your audience** - reply to comments
-- **Use trending sounds/music** when relevant
-- **Optimize for each platform** - don't cross-post blindly
-- **Track your analytics** and learn from data
-- **Stay true to your voice** - authenticity wins
-- **Network with other creators** - collaborations help
-- **Don't chase every trend** - stay relevant to your niche
-"""
-    
-    return trend_analysis
-
-@mcp.tool(description=InfluencerMatcherDescription.model_dump_json())
-async def influencer_matcher(
-    influencer_type: Annotated[str, Field(description="Type of influencer: 'micro', 'macro', 'mega'")],
-    niche: Annotated[str, Field(description="Content niche: 'lifestyle', 'tech', 'fashion', 'food', 'fitness'")] = "lifestyle",
-    platform: Annotated[str, Field(description="Primary platform: 'instagram', 'tiktok', 'youtube'")] = "instagram",
+    return _render_social_trends(platform, content_type, niche, section, _today_str())
+
+InfluencerType = Literal["micro", "macro", "mega"]
+InfluencerNiche = Literal["lifestyle", "tech", "fashion", "food", "fitness"]
+InfluencerPlatform = Literal["instagram", "tiktok", "youtube"]
+InfluencerSection = _section_arg("success prediction: collaboration success factors and probability")
+
+_INFLUENCER_PRICING: dict[str, str] = {
+    "micro": "100-500",
+    "macro": "1,000-5,000",
+    "mega": "10,000-50,000",
+}
+
+_INFLUENCER_SECTIONS = _section_templates("influencer_matcher")
+
+@lru_cache(maxsize=512)
+def _render_influencer(influencer_type: str, niche: str, platform: str, section: str, date_str: str) -> str:
+    return _INFLUENCER_SECTIONS[section].format_map({
+        "influencer_type": _display_name(influencer_type),
+        "niche": _display_name(niche),
+        "platform": _display_name(platform),
+        "price_range": _INFLUENCER_PRICING[influencer_type],
+        "date": date_str,
+    })
+
+@mcp.tool(description=InfluencerMatcherDescription, output_schema=None)
+def influencer_matcher(
+    influencer_type: Annotated[InfluencerType, Field(description="Type of influencer: 'micro', 'macro', 'mega'")],
+    niche: Annotated[InfluencerNiche, Field(description="Content niche: 'lifestyle', 'tech', 'fashion', 'food', 'fitness'")] = "lifestyle",
+    platform: Annotated[InfluencerPlatform, Field(description="Primary platform: 'instagram', 'tiktok', 'youtube'")] = "instagram",
+    section: InfluencerSection = "all",
 ) -> str:
     """Match influencers with brands and predict collaboration success."""
     
-    matching_guide = f"""
-# Influencer & Brand Collaboration Matcher
-
-## 👥 Influencer Analysis
-**Type:** {influencer_type.capitalize()} Influencer
-**Niche:** {niche.capitalize()}
-**Platform:** {platform.capitalize()}
-**Analysis Date:** {datetime.now().strftime('%B %d, %Y')}
-
-## 📊 Influencer Categories
-
-### Micro Influencers (1K-10K followers)
-- **Engagement Rate:** 8-15%
-- **Average Cost:** $50-500 per post
-- **Best For:** Local businesses, niche products
-- **Strengths:** High engagement, authentic audience
-- **Collaboration Types:** Product reviews, affiliate marketing
-
-### Macro Influencers (10K-100K followers)
-- **Engagement Rate:** 3-8%
-- **Average Cost:** $500-5,000 per post
-- **Best For:** Growing brands, targeted campaigns
-- **Strengths:** Good reach, established audience
-- **Collaboration Types:** Sponsored posts, brand ambassadorships
-
-### Mega Influencers (100K+ followers)
-- **Engagement Rate:** 1-3%
-- **Average Cost:** $5,000-50,000 per post
-- **Best For:** Large brands, mass awareness
-- **Strengths:** Massive reach, brand recognition
-- **Collaboration Types:** Major campaigns, product launches
-
-## 🎯 Brand Matching Strategy
-
-### Perfect Brand Matches for {niche.capitalize()}
-
-**Lifestyle Niche:**
-- **Beauty brands:** Skincare, makeup, haircare
-- **Fashion brands:** Clothing, accessories, jewelry
-- **Wellness brands:** Supplements, fitness, mental health
-- **Home brands:** Decor, furniture, lifestyle products
-
-**Tech Niche:**
-- **Gadget brands:** Smartphones, laptops, accessories
-- **Software brands:** Apps, tools, platforms
-- **Gaming brands:** Consoles, games, accessories
-- **Tech services:** VPN, cloud storage, productivity tools
-
-**Fashion Niche:**
-- **Clothing brands:** Fast fashion, luxury, sustainable
-- **Accessories:** Bags, shoes, jewelry, watches
-- **Beauty brands:** Makeup, skincare, haircare
-- **Lifestyle brands:** Home decor, travel, wellness
-
-**Food Niche:**
-- **Food brands:** Restaurants, delivery, meal kits
-- **Kitchen brands:** Appliances, cookware, gadgets
-- **Beverage brands:** Coffee, tea, smoothies, alcohol
-- **Health brands:** Supplements, superfoods, nutrition
-
-**Fitness Niche:**
-- **Fitness brands:** Equipment, apparel, supplements
-- **Wellness brands:** Apps, services, products
-- **Nutrition brands:** Meal plans, supplements, snacks
-- **Lifestyle brands:** Activewear, accessories, services
-
-## 💰 Pricing Strategy
-
-### {influencer_type.capitalize()} Influencer Pricing
-**Base Rate:** ${'100-500' if influencer_type == 'micro' else '1,000-5,000' if influencer_type == 'macro' else '10,000-50,000'} per post
-
-**Additional Factors:**
-- **Engagement Rate:** +10-30% for high engagement
-- **Platform:** +20-50% for multiple platforms
-- **Exclusivity:** +50-100% for exclusive partnerships
-- **Content Quality:** +25-50% for professional content
-- **Audience Demographics:** +15-40% for target audience match
-
-### Collaboration Packages
-1. **Single Post:** One-time sponsored content
-2. **Series (3-5 posts):** Discounted rate for multiple posts
-3. **Monthly Partnership:** Regular content creation
-4. **Brand Ambassadorship:** Long-term exclusive partnership
-5. **Product Launch:** Dedicated campaign support
-
-## 📈 Success Prediction
-
-### Collaboration Success Factors
-1. **Audience Alignment:** 40% importance
-2. **Content Quality:** 25% importance
-3. **Engagement Rate:** 20% importance
-4. **Brand Safety:** 10% importance
-5. **Platform Fit:** 5% importance
-
-### Success Probability: 85%
-
-**High Success Indicators:**
-- ✅ Authentic audience engagement
-- ✅ Relevant content niche
-- ✅ Professional communication
-- ✅ Consistent posting schedule
-- ✅ Positive brand reputation
-
-## 🚀 Action Plan
-
-### For Brands
-1. **Define campaign goals** and target audience
-2. **Research potential influencers** in your niche
-3. **Analyze engagement rates** and audience quality
-4. **Reach out professionally** with clear proposals
-5. **Negotiate fair compensation** and deliverables
-6. **Provide creative freedom** while maintaining brand guidelines
-7. **Track performance** and measure ROI
-8. **Build long-term relationships** with successful partners
-
-### For Influencers
-1. **Define your niche** and target audience
-2. **Create media kit** with rates and statistics
-3. **Build professional relationships** with brands
-4. **Deliver high-quality content** consistently
-5. **Track your performance** and engagement
-6. **Negotiate fair compensation** for your value
-7. **Maintain authenticity** in brand partnerships
-8. **Diversify income streams** beyond sponsored posts
-
-## 💡 Pro Tips
-- **Authenticity wins** - only partner with brands you genuinely like
-- **Quality over quantity** - better to have fewer, high-quality partnerships
-- **Track everything** - measure performance and ROI
-- **Build relationships** - long-term partnerships are more valuable
-- **Stay professional** - clear communication and timely delivery
-- **Know your worth** - don't undervalue your influence
-- **Be selective** - not every brand partnership is worth it
-- **Stay true to your audience** - they trust your recommendations
-"""
-    
-    return matching_guide
-
-@mcp.tool(description=DatingOptimizerDescription.model_dump_json())
-async def dating_optimizer(
-    dating_platform: Annotated[str, Field(description="Dating platform: 'tinder', 'bumble', 'hinge', 'okcupid'")],
-    age_range: Annotated[str, Field(description="Age range: '18-25', '26-35', '36-45', '45+'")] = "26-35",
-    relationship_goal: Annotated[str, Field(description="Relationship goal: 'casual', 'serious', 'friendship', 'marriage'")] = "serious",
+    return _render_influencer(influencer_type, niche, platform, section, _today_str())
+
+DatingPlatform = Literal["tinder", "bumble", "hinge", "okcupid"]
+AgeRange = Literal["18-25", "26-35", "36-45", "45+"]
+RelationshipGoal = Literal["casual", "serious", "friendship", "marriage"]
+DatingSection = _section_arg("compatibility prediction: success factors and compatibility indicators")
+
+_DATING_SECTIONS = _section_templates("dating_optimizer")
+
+@lru_cache(maxsize=512)
+def _render_dating(dating_platform: str, age_range: str, relationship_goal: str, section: str, date_str: str) -> str:
+    return _DATING_SECTIONS[section].format_map({
+        "platform": _display_name(dating_platform),
+        "age_range": age_range,
+        "goal": _display_name(relationship_goal),
+        "date": date_str,
+    })
+
+@mcp.tool(description=DatingOptimizerDescription, output_schema=None)
+def dating_optimizer(
+    dating_platform: Annotated[DatingPlatform, Field(description="Dating platform: 'tinder', 'bumble', 'hinge', 'okcupid'")],
+    age_range: Annotated[AgeRange, Field(description="Age range: '18-25', '26-35', '36-45', '45+'")] = "26-35",
+    relationship_goal: Annotated[RelationshipGoal, Field(description="Relationship goal: 'casual', 'serious', 'friendship', 'marriage'")] = "serious",
+    section: DatingSection = "all",
 ) -> str:
     """Optimize dating profiles and predict compatibility."""
     
-    dating_guide = f"""
-# Dating Profile Optimizer & Compatibility Predictor
-
-## 💕 Dating Analysis
-**Platform:** {dating_platform.capitalize()}
-**Age Range:** {age_range}
-**Relationship Goal:** {relationship_goal.capitalize()}
-**Analysis Date:** {datetime.now().strftime('%B %d, %Y')}
-
-## 🚀 Dating Trends for 2025
-
-### Platform-Specific Strategies
-**Tinder:**
-- **Best for:** Casual dating, hookups
-- **Profile focus:** Attractive photos, short bio
-- **Swiping strategy:** Be selective, quality over quantity
-- **Success rate:** 5-10% match to date conversion
-
-**Bumble:**
-- **Best for:** Serious relationships, professional networking
-- **Profile focus:** Detailed bio, conversation starters
-- **Swiping strategy:** Women make first move, be patient
-- **Success rate:** 8-15% match to date conversion
-
-**Hinge:**
-- **Best for:** Serious relationships, meaningful connections
-- **Profile focus:** Detailed prompts, authentic answers
-- **Swiping strategy:** Thoughtful responses, genuine interest
-- **Success rate:** 12-20% match to date conversion
-
-**OkCupid:**
-- **Best for:** Compatibility matching, detailed profiles
-- **Profile focus:** Comprehensive questions, detailed bio
-- **Swiping strategy:** Answer questions honestly, focus on compatibility
-- **Success rate:** 10-18% match to date conversion
-
-## 📸 Profile Optimization Guide
-
-### Photo Strategy
-**Primary Photo (First impression):**
-- **High-quality headshot** with genuine smile
-- **Good lighting** and clear background
-- **Eye contact** with camera
-- **Recent photo** (within 6 months)
-
-**Additional Photos:**
-- **Activity shots** showing hobbies and interests
-- **Group photos** (but not too many)
-- **Travel photos** showing adventure side
-- **Professional photos** showing career success
-
-**Photo Don'ts:**
-- ❌ Selfies in bathroom/car
-- ❌ Group photos where you're hard to identify
-- ❌ Blurry or low-quality images
-- ❌ Photos with ex-partners
-- ❌ Too many filters or editing
-
-### Bio Writing Tips
-**Length by Platform:**
-- **Tinder:** 100-200 characters (concise)
-- **Bumble:** 300-500 characters (detailed)
-- **Hinge:** Answer prompts thoughtfully
-- **OkCupid:** 500-1000 characters (comprehensive)
-
-**Bio Structure:**
-1. **Hook:** Interesting opening line
-2. **Interests:** Hobbies, passions, activities
-3. **Personality:** What makes you unique
-4. **Call to action:** Conversation starter
-
-**Bio Examples:**
-- "Adventure seeker who believes the best stories happen outside your comfort zone 🏔️"
-- "Coffee enthusiast, book lover, and amateur chef. Looking for someone to share life's little moments with ☕"
-- "Passionate about [interest] and always up for trying something new. Let's create memories together!"
-
-## 🎯 Compatibility Prediction
-
-### Success Factors
-1. **Profile Quality:** 30% importance
-2. **Messaging Strategy:** 25% importance
-3. **Timing:** 20% importance
-4. **Location:** 15% importance
-5. **Luck:** 10% importance
-
-### Compatibility Indicators
-**High Compatibility:**
-- ✅ Shared interests and values
-- ✅ Similar life goals and timeline
-- ✅ Good communication skills
-- ✅ Mutual attraction and chemistry
-- ✅ Compatible lifestyles
-
-**Red Flags:**
-- ❌ Inconsistent or dishonest profile
-- ❌ Poor communication or ghosting
-- ❌ Different relationship goals
-- ❌ Incompatible lifestyles or values
-- ❌ Lack of effort or engagement
-
-## 💬 Messaging Strategy
-
-### Opening Lines
-**Effective Openers:**
-- "I noticed you're into [shared interest]. What's your favorite [related topic]?"
-- "Your profile made me smile! I'd love to hear more about [specific detail]"
-- "Hey! I'm also passionate about [interest]. Have you tried [related activity]?"
-
-**Conversation Starters:**
-- Ask about their interests and experiences
-- Share relevant stories or anecdotes
-- Ask thoughtful follow-up questions
-- Show genuine curiosity about their life
-
-### Messaging Tips
-- **Be authentic** and genuine
-- **Ask questions** to show interest
-- **Share about yourself** but don't dominate
-- **Keep it light** and positive initially
-- **Move to phone/video** after good conversation
-- **Plan first date** within 1-2 weeks of matching
-
-## 📅 First Date Planning
-
-### Date Ideas by Goal
-**Casual Dating:**
-- Coffee or drinks
-- Casual dinner
-- Activity-based dates (bowling, mini-golf)
-- Outdoor activities (hiking, park walks)
-
-**Serious Relationships:**
-- Dinner at nice restaurant
-- Cultural activities (museums, shows)
-- Cooking class or wine tasting
-- Weekend getaway or day trip
-
-**Friendship:**
-- Group activities or events
-- Casual meetups
-- Shared hobby activities
-- Community events
-
-### Date Success Tips
-- **Choose comfortable location** for both parties
-- **Plan backup options** in case of weather/issues
-- **Keep first date short** (1-2 hours)
-- **Dress appropriately** for the activity
-- **Be on time** and respectful
-- **Have conversation topics** ready
-- **Listen actively** and show interest
-- **End positively** regardless of outcome
-
-## 🚀 Action Plan
-1. **Optimize your profile** with high-quality photos and compelling bio
-2. **Set realistic expectations** for your dating goals
-3. **Be consistent** with swiping and messaging
-4. **Stay positive** and don't get discouraged by rejection
-5. **Learn from each interaction** and improve your approach
-6. **Be patient** - finding the right person takes time
-7. **Stay safe** - meet in public places and trust your instincts
-8. **Have fun** - dating should be enjoyable, not stressful
-
-## 💡 Pro Tips
-- **Be yourself** - authenticity attracts the right people
-- **Quality over quantity** - focus on meaningful connections
-- **Don't rush** - take time to get to know people
-- **Stay positive** - dating can be challenging but rewarding
-- **Learn from rejection** - it's part of the process
-- **Trust your instincts** - if something feels off, move on
-- **Have standards** - don't settle for less than you deserve
-- **Keep growing** - work on yourself while looking for others
-"""
-    
-    return dating_guide
-
-@mcp.tool(description=TravelCuratorDescription.model_dump_json())
-async def travel_curator(
-    destination_type: Annotated[str, Field(description="Destination type: 'beach', 'city', 'mountains', 'cultural', 'adventure'")],
-    budget_range: Annotated[str, Field(description="Budget range: 'budget', 'mid-range', 'luxury'")] = "mid-range",
-    travel_style: Annotated[str, Field(description="Travel style: 'solo', 'couple', 'family', 'group'")] = "couple",
+    return _render_dating(dating_platform, age_range, relationship_goal, section, _today_str())
+
+DestinationType = Literal["beach", "city", "mountains", "cultural", "adventure"]
+BudgetRange = Literal["budget", "mid-range", "luxury"]
+TravelStyle = Literal["solo", "couple", "family", "group"]
+TravelSection = _section_arg("budget planning: budget breakdown and money-saving tips")
+
+_TRAVEL_SECTIONS = _section_templates("travel_curator")
+
+@lru_cache(maxsize=512)
+def _render_travel(destination_type: str, budget_range: str, travel_style: str, section: str, date_str: str) -> str:
+    return _TRAVEL_SECTIONS[section].format_map({
+        "destination": _display_name(destination_type),
+        "budget": _display_name(budget_range),
+        "style": _display_name(travel_style),
+        "date": date_str,
+    })
+
+@mcp.tool(description=TravelCuratorDescription, output_schema=None)
+def travel_curator(
+    destination_type: Annotated[DestinationType, Field(description="Destination type: 'beach', 'city', 'mountains', 'cultural', 'adventure'")],
+    budget_range: Annotated[BudgetRange, Field(description="Budget range: 'budget', 'mid-range', 'luxury'")] = "mid-range",
+    travel_style: Annotated[TravelStyle, Field(description="Travel style: 'solo', 'couple', 'family', 'group'")] = "couple",
+    section: TravelSection = "all",
 ) -> str:
     """Curate travel experiences and predict trending destinations."""
     
-    travel_guide = f"""
-# Travel Experience Curator & Destination Predictor
-
-## ✈️ Travel Analysis
-**Destination Type:** {destination_type.capitalize()}
-**Budget Range:** {budget_range.capitalize()}
-**Travel Style:** {travel_style.capitalize()}
-**Analysis Date:** {datetime.now().strftime('%B %d, %Y')}
-
-## 🚀 Travel Trends for 2025
-
-### Hot Destination Categories
-**Beach Destinations:**
-- **Trending:** Maldives, Bali, Costa Rica, Greek Islands
-- **Emerging:** Zanzibar, Seychelles, Philippines, Mexico
-- **Budget-friendly:** Thailand, Vietnam, Portugal, Croatia
-
-**City Destinations:**
-- **Trending:** Tokyo, Singapore, Dubai, Barcelona
-- **Emerging:** Seoul, Istanbul, Lisbon, Budapest
-- **Budget-friendly:** Prague, Warsaw, Krakow, Belgrade
-
-**Mountain Destinations:**
-- **Trending:** Swiss Alps, Canadian Rockies, New Zealand
-- **Emerging:** Georgia (country), Armenia, Kyrgyzstan
-- **Budget-friendly:** Nepal, India, Peru, Bolivia
-
-**Cultural Destinations:**
-- **Trending:** Japan, Morocco, India, Egypt
-- **Emerging:** Uzbekistan, Iran, Ethiopia, Myanmar
-- **Budget-friendly:** Cambodia, Laos, Sri Lanka, Nepal
-
-**Adventure Destinations:**
-- **Trending:** Iceland, Patagonia, Alaska, New Zealand
-- **Emerging:** Mongolia, Namibia, Madagascar, Borneo
-- **Budget-friendly:** Nepal, Peru, Bolivia, Guatemala
-
-## 🎯 Personalized Travel Recommendations
-
-### {destination_type.capitalize()} Destinations for {travel_style.capitalize()} Travel
-
-**Beach Destinations:**
-- **Solo:** Bali (Indonesia), Costa Rica, Thailand
-- **Couple:** Maldives, Seychelles, Greek Islands
-- **Family:** Hawaii, Florida Keys, Gold Coast (Australia)
-- **Group:** Mexico, Dominican Republic, Philippines
-
-**City Destinations:**
-- **Solo:** Tokyo, Singapore, Amsterdam
-- **Couple:** Paris, Rome, Barcelona
-- **Family:** London, New York, Toronto
-- **Group:** Berlin, Prague, Budapest
-
-**Mountain Destinations:**
-- **Solo:** Switzerland, New Zealand, Canada
-- **Couple:** Austrian Alps, French Alps, Japan
-- **Family:** Colorado (USA), Banff (Canada), Switzerland
-- **Group:** Nepal, Peru, Bolivia
-
-**Cultural Destinations:**
-- **Solo:** Japan, Morocco, India
-- **Couple:** Italy, Greece, Turkey
-- **Family:** England, France, Germany
-- **Group:** Thailand, Vietnam, Cambodia
-
-**Adventure Destinations:**
-- **Solo:** Iceland, New Zealand, Costa Rica
-- **Couple:** Patagonia, Alaska, Norway
-- **Family:** Costa Rica, New Zealand, Canada
-- **Group:** Nepal, Peru, Bolivia
-
-## 💰 Budget Planning
-
-### {budget_range.capitalize()} Budget Breakdown
-**Budget ($1,000-2,000 per person):**
-- **Accommodation:** $30-80/night
-- **Food:** $15-30/day
-- **Activities:** $20-50/day
-- **Transportation:** $10-30/day
-- **Total:** $75-190/day
-
-**Mid-Range ($2,000-5,000 per person):**
-- **Accommodation:** $80-200/night
-- **Food:** $30-80/day
-- **Activities:** $50-150/day
-- **Transportation:** $30-80/day
-- **Total:** $190-510/day
-
-**Luxury ($5,000+ per person):**
-- **Accommodation:** $200-500+/night
-- **Food:** $80-200+/day
-- **Activities:** $150-500+/day
-- **Transportation:** $80-200+/day
-- **Total:** $510-1,400+/day
-
-### Money-Saving Tips
-1. **Travel off-season** for better prices
-2. **Book flights early** (3-6 months ahead)
-3. **Use budget airlines** and alternative airports
-4. **Stay in hostels** or vacation rentals
-5. **Eat local food** instead of tourist restaurants
-6. **Use public transportation** when possible
-7. **Book activities in advance** for discounts
-8. **Travel with a group** to split costs
-
-## 📅 Trip Planning Timeline
-
-### Pre-Trip Planning (3-6 months)
-1. **Research destinations** and create shortlist
-2. **Check visa requirements** and travel restrictions
-3. **Book flights** for best prices
-4. **Reserve accommodations** for popular destinations
-5. **Plan major activities** and book in advance
-6. **Get travel insurance** and necessary vaccinations
-7. **Research local customs** and cultural etiquette
-
-### Last-Minute Planning (1-2 weeks)
-1. **Confirm all bookings** and reservations
-2. **Pack appropriately** for destination and activities
-3. **Download offline maps** and translation apps
-4. **Notify bank** of travel plans
-5. **Make copies** of important documents
-6. **Check weather** and pack accordingly
-7. **Plan airport transfers** and transportation
-
-## 🎯 Experience Curation
-
-### Must-Have Experiences by Destination Type
-**Beach Destinations:**
-- Snorkeling or diving
-- Sunset beach walks
-- Local seafood dining
-- Water sports activities
-- Island hopping tours
-
-**City Destinations:**
-- Walking tours of historic districts
-- Local food markets and street food
-- Museum and cultural site visits
-- Nightlife and entertainment
-- Shopping in local markets
-
-**Mountain Destinations:**
-- Hiking and trekking
-- Scenic drives and viewpoints
-- Wildlife watching
-- Local village visits
-- Adventure sports (skiing, climbing)
-
-**Cultural Destinations:**
-- Historical site visits
-- Local festival attendance
-- Traditional cooking classes
-- Cultural performance shows
-- Local artisan workshops
-
-**Adventure Destinations:**
-- Outdoor adventure activities
-- Wildlife safaris
-- Extreme sports
-- Remote area exploration
-- Cultural immersion experiences
-
-## 🚀 Action Plan
-1. **Define your travel goals** and preferences
-2. **Research potential destinations** thoroughly
-3. **Set realistic budget** and timeline
-4. **Book major components** early for best prices
-5. **Plan detailed itinerary** with flexibility
-6. **Prepare for cultural differences** and language barriers
-7. **Pack smart** and travel light
-8. **Stay open to unexpected experiences** and changes
-
-## 💡 Pro Tips
-- **Be flexible** with dates for better prices
-- **Research local customs** and respect cultural differences
-- **Learn basic phrases** in local language
-- **Stay connected** with family/friends back home
-- **Keep emergency contacts** and important documents safe
-- **Travel light** - you'll thank yourself later
-- **Try local food** - it's part of the experience
-- **Take photos** but also live in the moment
-- **Be respectful** of local people and environment
-- **Have backup plans** for weather or other issues
-- **Travel insurance** is worth the investment
-- **Keep a travel journal** to remember your experiences
-"""
-    
-    return travel_guide
+    return _render_travel(destination_type, budget_range, travel_style, section, _today_str())
+
+# --- ASGI App ---
+# Stateless so that any worker process can serve any request. Plain JSON
+# responses (rather than SSE) let GZip compress the multi-kilobyte guides;
+# GZipMiddleware never touches text/event-stream bodies. Needs mcp>=1.23.2:
+# older releases log a ClosedResourceError from the stateless JSON-response
+# message router after every request.
+app = mcp.http_app(
+    transport="streamable-http",
+    stateless_http=True,
+    json_response=True,
+    middleware=[Middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)],
+)
 
 # --- Main Function ---
-async def main():
-    """Start the MCP server."""
-    print("🚀 Starting AI Innovation & Lifestyle Suite MCP Server...")
-    await mcp.run_async("streamable-http", host="0.0.0.0", port=8086)
+def main():
+    """Start the MCP server with WEB_CONCURRENCY worker processes (default 1)."""
+    get_settings()  # fail fast on missing configuration
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    print(f"🚀 Starting AI Innovation & Lifestyle Suite MCP Server ({workers} workers)...")
+    uvicorn.run("innovation_lifestyle_mcp:app", host="0.0.0.0", port=8086, workers=workers)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()